@@ -2,86 +2,229 @@
 VortexL2 Configuration Management
 
 Handles loading/saving multiple tunnel configurations from /etc/vortexl2/tunnels/
-Each tunnel has its own YAML config file.
+Each tunnel has its own config file. Files keep their .yaml names but are written
+as JSON (a YAML subset, so YAML readers still work); legacy YAML is still read.
 """
 
+import copy
+import json
 import os
-import yaml
+import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, Mapping, Tuple
 
 
 CONFIG_DIR = Path("/etc/vortexl2")
 TUNNELS_DIR = CONFIG_DIR / "tunnels"
 GLOBAL_CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# Sentinel for "key not present", distinct from a stored None
+_MISSING = object()
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_config_file(path: Path) -> Dict[str, Any]:
+    """Load a config file, returning an empty dict if it is missing or unreadable."""
+    try:
+        # Read raw bytes straight off the fd in one sized read
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            size = os.fstat(fd).st_size
+            raw = os.read(fd, size)
+            while len(raw) < size:
+                chunk = os.read(fd, size - len(raw))
+                if not chunk:
+                    break
+                raw += chunk
+        finally:
+            os.close(fd)
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            # Written before the switch to JSON; rewritten as JSON on next save
+            data = _parse_legacy_yaml(raw)
+        return data or {}
+    except Exception:
+        return {}
+
+
+def _parse_legacy_yaml(raw: bytes) -> Any:
+    """Parse a pre-JSON config file. PyYAML is only imported when one is found."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+    return yaml.load(raw, Loader=SafeLoader)
+
+
+def _write_config_file(path: Path, data: Dict[str, Any]) -> None:
+    """Atomically replace a config file with JSON, readable only by root."""
+    buf = json.dumps(data, indent=2).encode()
+    # A private temp file per writer (mkstemp creates it 0600), so concurrent saves can't collide
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        # Don't leave a half-written temp file behind in /etc/vortexl2
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _ConfigField:
+    """Config key exposed as an attribute; assignments go through the owner's _set()."""
+    
+    def __init__(self, default: Any = None, default_factory: Optional[Callable[[], Any]] = None):
+        self.default = default
+        # Used instead of default for mutable values, so each read gets a fresh object
+        self.default_factory = default_factory
+    
+    def __set_name__(self, owner, name: str) -> None:
+        self.key = name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        config = obj._config
+        if self.key in config:
+            return config[self.key]
+        if self.default_factory is not None:
+            return self.default_factory()
+        return self.default
+    
+    def __set__(self, obj, value) -> None:
+        obj._set(self.key, value)
+
 
 class GlobalConfig:
     """Global configuration for VortexL2 (forward mode, tunnel mode, etc.)."""
     
-    VALID_FORWARD_MODES = ["none", "haproxy", "socat"]
-    VALID_TUNNEL_MODES = ["l2tpv3", "easytier"]
+    VALID_FORWARD_MODES = ("none", "haproxy", "socat")
+    VALID_TUNNEL_MODES = ("l2tpv3", "easytier")
+    # Hashed copies for membership checks (callers rule out non-str values first, which
+    # may be unhashable); the tuples keep their order for messages
+    _FORWARD_MODES = frozenset(VALID_FORWARD_MODES)
+    _TUNNEL_MODES = frozenset(VALID_TUNNEL_MODES)
+    
+    __slots__ = ("_config", "_loaded", "_stamp")
+    
+    _instance: Optional["GlobalConfig"] = None
     
     def __init__(self):
+        # The file is read on first access, not here
         self._config: Dict[str, Any] = {}
-        self._load()
+        self._loaded = False
+        self._stamp: Optional[Tuple[int, int]] = None
+    
+    @classmethod
+    def instance(cls) -> "GlobalConfig":
+        """Return the shared GlobalConfig, re-reading the file only if it changed."""
+        if cls._instance is None:
+            cls._instance = cls()
+        elif cls._instance._stamp != _file_stamp(GLOBAL_CONFIG_FILE):
+            cls._instance._loaded = False
+        return cls._instance
+    
+    def _ensure_loaded(self) -> None:
+        """Load the config file if it hasn't been read yet."""
+        if not self._loaded:
+            self._load()
     
     def _load(self) -> None:
         """Load global configuration from file."""
-        if GLOBAL_CONFIG_FILE.exists():
-            try:
-                with open(GLOBAL_CONFIG_FILE, 'r') as f:
-                    self._config = yaml.safe_load(f) or {}
-            except Exception:
-                self._config = {}
+        # Stamp before reading: a write in between just triggers one extra reload
+        self._stamp = _file_stamp(GLOBAL_CONFIG_FILE)
+        self._config = _read_config_file(GLOBAL_CONFIG_FILE)
+        self._loaded = True
     
     def _save(self) -> None:
         """Save global configuration to file."""
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(GLOBAL_CONFIG_FILE, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
-        os.chmod(GLOBAL_CONFIG_FILE, 0o600)
+        _write_config_file(GLOBAL_CONFIG_FILE, self._config)
+        self._stamp = _file_stamp(GLOBAL_CONFIG_FILE)
+    
+    def _set(self, key: str, value: Any) -> None:
+        """Update a key, saving only if the value actually changed."""
+        self._ensure_loaded()
+        current = self._config.get(key, _MISSING)
+        # The same object may have been edited in place via the getter, so only skip
+        # the save for a distinct but equal value
+        if current is not value and current == value:
+            return
+        self._config[key] = value
+        self._save()
     
     @property
     def forward_mode(self) -> str:
         """Get forwarding mode: 'none' or 'haproxy'."""
+        self._ensure_loaded()
         mode = self._config.get("forward_mode", "none")
-        if mode not in self.VALID_FORWARD_MODES:
+        if not isinstance(mode, str) or mode not in self._FORWARD_MODES:
             return "none"
         return mode
     
     @forward_mode.setter
     def forward_mode(self, value: str) -> None:
         """Set forwarding mode."""
-        if value not in self.VALID_FORWARD_MODES:
+        if not isinstance(value, str) or value not in self._FORWARD_MODES:
             raise ValueError(f"Invalid forward mode: {value}. Must be one of {self.VALID_FORWARD_MODES}")
-        self._config["forward_mode"] = value
-        self._save()
+        self._set("forward_mode", value)
     
     @property
     def tunnel_mode(self) -> str:
         """Get tunnel mode: 'l2tpv3' or 'easytier'."""
+        self._ensure_loaded()
         mode = self._config.get("tunnel_mode", "l2tpv3")
-        if mode not in self.VALID_TUNNEL_MODES:
+        if not isinstance(mode, str) or mode not in self._TUNNEL_MODES:
             return "l2tpv3"
         return mode
     
     @tunnel_mode.setter
     def tunnel_mode(self, value: str) -> None:
         """Set tunnel mode."""
-        if value not in self.VALID_TUNNEL_MODES:
+        if not isinstance(value, str) or value not in self._TUNNEL_MODES:
             raise ValueError(f"Invalid tunnel mode: {value}. Must be one of {self.VALID_TUNNEL_MODES}")
-        self._config["tunnel_mode"] = value
-        self._save()
+        self._set("tunnel_mode", value)
     
     def to_dict(self) -> Dict[str, Any]:
         """Return configuration as dictionary."""
+        self._ensure_loaded()
         return self._config.copy()
 
 
 class TunnelConfig:
     """Configuration for a single tunnel."""
     
+    __slots__ = (
+        "_name", "_config", "_file_path", "_auto_save",
+        "_in_txn", "_dirty",
+    )
+    
+    VALID_ENCAP_TYPES = ("ip", "udp")
+    _ENCAP_TYPES = frozenset(VALID_ENCAP_TYPES)
+    
     # Default values for new tunnels
     DEFAULTS = {
         "name": "tunnel1",
@@ -98,12 +241,16 @@ class TunnelConfig:
         "encap_type": "ip",      # "ip" or "udp"
         "udp_port": 55555,       # Only used when encap_type == "udp"
     }
+    _DEFAULTS_ITEMS = tuple(DEFAULTS.items())
+    DEFAULTS = MappingProxyType(DEFAULTS)
     
     def __init__(self, name: str, config_data: Dict[str, Any] = None, auto_save: bool = True):
         self._name = name
         self._config: Dict[str, Any] = {}
         self._file_path = TUNNELS_DIR / f"{name}.yaml"
         self._auto_save = auto_save
+        self._in_txn = 0
+        self._dirty = False
         
         if config_data:
             self._config = config_data
@@ -111,41 +258,54 @@ class TunnelConfig:
             self._load()
         
         # Apply defaults for missing keys
-        for key, default in self.DEFAULTS.items():
-            if key not in self._config:
-                self._config[key] = default
+        config = self._config
+        for key, default in self._DEFAULTS_ITEMS:
+            if key not in config:
+                # Copy so in-place edits (add_port) never reach the shared defaults
+                config[key] = copy.copy(default)
         
         # Ensure name matches
         self._config["name"] = name
     
     def _load(self) -> None:
         """Load configuration from file."""
-        if self._file_path.exists():
-            try:
-                with open(self._file_path, 'r') as f:
-                    self._config = yaml.safe_load(f) or {}
-            except Exception:
-                self._config = {}
+        self._config = _read_config_file(self._file_path)
+    
+    def __enter__(self) -> "TunnelConfig":
+        """Batch setter writes; the file is saved once when the outermost block exits."""
+        self._in_txn += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # A block that raised is not flushed; its changes stay pending for the next save
+        self._in_txn -= 1
+        if not self._in_txn and self._dirty and exc_type is None:
+            self._save()
     
     def _save(self) -> None:
         """Save configuration to file if auto_save is enabled."""
         if not self._auto_save:
             return
-        TUNNELS_DIR.mkdir(parents=True, exist_ok=True)
-        
-        with open(self._file_path, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
-        
-        os.chmod(self._file_path, 0o600)
+        if self._in_txn:
+            self._dirty = True
+            return
+        self._dirty = False
+        _write_config_file(self._file_path, self._config)
+    
+    def _set(self, key: str, value: Any) -> None:
+        """Update a key, saving only if the value actually changed."""
+        current = self._config.get(key, _MISSING)
+        # The same object may have been edited in place via the getter, so only skip
+        # the save for a distinct but equal value
+        if current is not value and current == value:
+            return
+        self._config[key] = value
+        self._save()
     
     def save(self) -> None:
         """Public method to force save configuration (ignores auto_save)."""
-        TUNNELS_DIR.mkdir(parents=True, exist_ok=True)
-        
-        with open(self._file_path, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
-        
-        os.chmod(self._file_path, 0o600)
+        self._dirty = False
+        _write_config_file(self._file_path, self._config)
         self._auto_save = True  # Enable auto_save after manual save
     
     def delete(self) -> bool:
@@ -161,103 +321,32 @@ class TunnelConfig:
     
     @name.setter
     def name(self, value: str) -> None:
-        self._config["name"] = value
-        self._save()
-    
-    @property
-    def local_ip(self) -> Optional[str]:
-        return self._config.get("local_ip")
-    
-    @local_ip.setter
-    def local_ip(self, value: str) -> None:
-        self._config["local_ip"] = value
-        self._save()
-    
-    @property
-    def remote_ip(self) -> Optional[str]:
-        return self._config.get("remote_ip")
-    
-    @remote_ip.setter
-    def remote_ip(self, value: str) -> None:
-        self._config["remote_ip"] = value
-        self._save()
-    
-    @property
-    def interface_ip(self) -> str:
-        return self._config.get("interface_ip", "10.30.30.1/24")
-    
-    @interface_ip.setter
-    def interface_ip(self, value: str) -> None:
-        self._config["interface_ip"] = value
-        self._save()
-    
-    @property
-    def remote_forward_ip(self) -> str:
-        return self._config.get("remote_forward_ip", "10.30.30.2")
-    
-    @remote_forward_ip.setter
-    def remote_forward_ip(self, value: str) -> None:
-        self._config["remote_forward_ip"] = value
-        self._save()
-    
-    @property
-    def tunnel_id(self) -> int:
-        return self._config.get("tunnel_id", 1000)
-    
-    @tunnel_id.setter
-    def tunnel_id(self, value: int) -> None:
-        self._config["tunnel_id"] = value
-        self._save()
-    
-    @property
-    def peer_tunnel_id(self) -> int:
-        return self._config.get("peer_tunnel_id", 2000)
-    
-    @peer_tunnel_id.setter
-    def peer_tunnel_id(self, value: int) -> None:
-        self._config["peer_tunnel_id"] = value
-        self._save()
-    
-    @property
-    def session_id(self) -> int:
-        return self._config.get("session_id", 10)
-    
-    @session_id.setter
-    def session_id(self, value: int) -> None:
-        self._config["session_id"] = value
-        self._save()
-    
-    @property
-    def peer_session_id(self) -> int:
-        return self._config.get("peer_session_id", 20)
-    
-    @peer_session_id.setter
-    def peer_session_id(self, value: int) -> None:
-        self._config["peer_session_id"] = value
-        self._save()
-    
-    @property
-    def interface_index(self) -> int:
-        return self._config.get("interface_index", 0)
-    
-    @interface_index.setter
-    def interface_index(self, value: int) -> None:
-        self._config["interface_index"] = value
-        self._save()
+        self._set("name", value)
+    
+    local_ip = _ConfigField()
+    remote_ip = _ConfigField()
+    interface_ip = _ConfigField("10.30.30.1/24")
+    remote_forward_ip = _ConfigField("10.30.30.2")
+    tunnel_id = _ConfigField(1000)
+    peer_tunnel_id = _ConfigField(2000)
+    session_id = _ConfigField(10)
+    peer_session_id = _ConfigField(20)
+    interface_index = _ConfigField(0)
+    
+    # (key, default) for get_tunnel_ids, matching the fields above
+    _TUNNEL_ID_FIELDS = (
+        ("tunnel_id", 1000),
+        ("peer_tunnel_id", 2000),
+        ("session_id", 10),
+        ("peer_session_id", 20),
+    )
     
     @property
     def interface_name(self) -> str:
         """Get the interface name for this tunnel (l2tpeth0, l2tpeth1, etc.)"""
         return f"l2tpeth{self.interface_index}"
     
-    @property
-    def forwarded_ports(self) -> List[int]:
-        return self._config.get("forwarded_ports", [])
-    
-    @forwarded_ports.setter
-    def forwarded_ports(self, value: List[int]) -> None:
-        self._config["forwarded_ports"] = value
-        self._save()
+    forwarded_ports = _ConfigField(default_factory=list)
     
     @property
     def encap_type(self) -> str:
@@ -267,10 +356,9 @@ class TunnelConfig:
     @encap_type.setter
     def encap_type(self, value: str) -> None:
         """Set encapsulation type."""
-        if value not in ["ip", "udp"]:
+        if not isinstance(value, str) or value not in self._ENCAP_TYPES:
             raise ValueError("encap_type must be 'ip' or 'udp'")
-        self._config["encap_type"] = value
-        self._save()
+        self._set("encap_type", value)
     
     @property
     def udp_port(self) -> int:
@@ -282,31 +370,27 @@ class TunnelConfig:
         """Set UDP port."""
         if not (1 <= value <= 65535):
             raise ValueError("UDP port must be between 1 and 65535")
-        self._config["udp_port"] = value
-        self._save()
+        self._set("udp_port", value)
     
     def get_tunnel_ids(self) -> Dict[str, int]:
         """Get all tunnel IDs as a dictionary."""
-        return {
-            "tunnel_id": self.tunnel_id,
-            "peer_tunnel_id": self.peer_tunnel_id,
-            "session_id": self.session_id,
-            "peer_session_id": self.peer_session_id,
-        }
+        get = self._config.get
+        return {key: get(key, default) for key, default in self._TUNNEL_ID_FIELDS}
     
     def add_port(self, port: int) -> None:
         """Add a port to forwarded ports list."""
-        ports = self.forwarded_ports
+        # Edit the stored list in place and save once (no copy, no setter round-trip)
+        ports = self._config.setdefault("forwarded_ports", [])
         if port not in ports:
             ports.append(port)
-            self.forwarded_ports = ports
+            self._save()
     
     def remove_port(self, port: int) -> None:
         """Remove a port from forwarded ports list."""
-        ports = self.forwarded_ports
+        ports = self._config.setdefault("forwarded_ports", [])
         if port in ports:
             ports.remove(port)
-            self.forwarded_ports = ports
+            self._save()
     
     def is_configured(self) -> bool:
         """Check if basic configuration is complete."""
@@ -315,6 +399,13 @@ class TunnelConfig:
     def to_dict(self) -> Dict[str, Any]:
         """Return configuration as dictionary."""
         return self._config.copy()
+    
+    def view(self) -> Mapping[str, Any]:
+        """Return a live read-only view of the configuration, without copying.
+        
+        Not JSON/YAML serializable as-is; use to_dict() for that.
+        """
+        return MappingProxyType(self._config)
 
 
 class ConfigManager:
@@ -63,20 +63,22 @@ class EasyTierConfig:
             except Exception:
                 self._config = {}
     
+    def _write(self) -> None:
+        TUNNELS_DIR.mkdir(parents=True, exist_ok=True)
+        # Created 0600; fchmod also tightens files that already existed with a wider mode
+        fd = os.open(self._file_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC | os.O_CLOEXEC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            os.fchmod(fd, 0o600)
+            yaml.dump(self._config, f, default_flow_style=False)
+    
     def _save(self) -> None:
         if not self._auto_save:
             return
-        TUNNELS_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self._file_path, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
-        os.chmod(self._file_path, 0o600)
+        self._write()
     
     def save(self) -> None:
         """Force save configuration."""
-        TUNNELS_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self._file_path, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
-        os.chmod(self._file_path, 0o600)
+        self._write()
         self._auto_save = True
     
     def delete(self) -> bool:
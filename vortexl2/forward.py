@@ -20,7 +20,7 @@ def get_forward_manager(config=None):
         SocatManager if forward_mode is 'socat',
         None otherwise.
     """
-    global_config = GlobalConfig()
+    global_config = GlobalConfig.instance()
     mode = global_config.forward_mode
     
     if mode == "haproxy":
@@ -33,12 +33,12 @@ def get_forward_manager(config=None):
 
 def get_forward_mode() -> str:
     """Get current forward mode (none or haproxy)."""
-    return GlobalConfig().forward_mode
+    return GlobalConfig.instance().forward_mode
 
 
 def set_forward_mode(mode: str) -> None:
     """Set forward mode (none or haproxy)."""
-    GlobalConfig().forward_mode = mode
+    GlobalConfig.instance().forward_mode = mode
 
 
 # For backward compatibility
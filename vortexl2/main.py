@@ -38,7 +38,7 @@ def check_root():
 
 def get_tunnel_mode() -> str:
     """Get current tunnel mode from global config."""
-    global_config = GlobalConfig()
+    global_config = GlobalConfig.instance()
     return global_config.tunnel_mode
 
 